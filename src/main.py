@@ -25,6 +25,18 @@ INDIVIDUAL_COOLDOWN = rate_config['individual_cooldown']
 
 CONTACT_FILE = config['contacts']
 
+# Original contact CSV columns, shared by the failure and success logs
+CONTACT_FIELDNAMES = [
+    'License Number', 'License Type', 'License Type Code', 'License Status', 
+    'License Status Code', 'Issued Date', 'Effective Date', 'Expiration Date',
+    'Application Number', 'Entity Name', 'Address Line 1', 'Address Line 2',
+    'City', 'State', 'Zip Code', 'County', 'Region', 'Business Website',
+    'Operational Status', 'Business Purpose', 'Tier Type', 'Processor Type',
+    'Primary Contact Name', 'Email', 'first_name'
+]
+FAILED_LOG_FIELDNAMES = CONTACT_FIELDNAMES + ['email_status', 'status_code', 'error_message', 'timestamp']
+SUCCESSFUL_LOG_FIELDNAMES = CONTACT_FIELDNAMES + ['email_status', 'timestamp']
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter to add colors to log levels."""
     
@@ -92,16 +104,7 @@ def log_failed_emails(failed_contacts):
     bounced_file_path = 'logs/failures.csv'
     with open(bounced_file_path, 'w', newline='', encoding='utf-8') as csvfile:
         # Use all original CSV fieldnames plus tracking fields
-        fieldnames = [
-            'License Number', 'License Type', 'License Type Code', 'License Status', 
-            'License Status Code', 'Issued Date', 'Effective Date', 'Expiration Date',
-            'Application Number', 'Entity Name', 'Address Line 1', 'Address Line 2',
-            'City', 'State', 'Zip Code', 'County', 'Region', 'Business Website',
-            'Operational Status', 'Business Purpose', 'Tier Type', 'Processor Type',
-            'Primary Contact Name', 'Email', 'first_name', 'email_status', 'status_code', 
-            'error_message', 'timestamp'
-        ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.DictWriter(csvfile, fieldnames=FAILED_LOG_FIELDNAMES)
         writer.writeheader()
         writer.writerows(failed_contacts)
     logger.info(f"❌ Failed emails logged to: {bounced_file_path}")
@@ -117,22 +120,16 @@ def log_successful_emails(contacts, failed_contacts):
     success_file_path = 'logs/successful.csv'
     with open(success_file_path, 'w', newline='', encoding='utf-8') as csvfile:
         # Use all original CSV fieldnames plus tracking fields
-        fieldnames = [
-            'License Number', 'License Type', 'License Type Code', 'License Status', 
-            'License Status Code', 'Issued Date', 'Effective Date', 'Expiration Date',
-            'Application Number', 'Entity Name', 'Address Line 1', 'Address Line 2',
-            'City', 'State', 'Zip Code', 'County', 'Region', 'Business Website',
-            'Operational Status', 'Business Purpose', 'Tier Type', 'Processor Type',
-            'Primary Contact Name', 'Email', 'first_name', 'email_status', 'timestamp'
-        ]
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.DictWriter(csvfile, fieldnames=SUCCESSFUL_LOG_FIELDNAMES)
         writer.writeheader()
-        
+
+        # All rows are written in one pass, so stamp them with a single timestamp
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         for contact in successful_contacts:
             # Create a copy of the contact and add tracking fields
             log_entry = contact.copy()
             log_entry['email_status'] = 'success'
-            log_entry['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            log_entry['timestamp'] = timestamp
             writer.writerow(log_entry)
     logger.info(f"✅ Successful emails logged to: {success_file_path}")
     
@@ -211,6 +208,9 @@ def send_in_bulk():
     
     logger.info(f"🚀 Starting email campaign for {len(contacts)} contacts")
     
+    # The cooldown is fixed for the whole run, so build its progress message once
+    cooldown_message = f"⏳ Sleeping for {INDIVIDUAL_COOLDOWN} seconds before next email to avoid rate limiting..."
+    
     # Use tqdm for progress tracking
     for contact in tqdm(contacts, desc="📧 Sending emails", unit="email"):
         try:
@@ -254,7 +254,7 @@ def send_in_bulk():
             logger.error(f"❌ Email to {contact['Email']} failed to send with the exception {e.__class__.__name__} - {e}. Sleeping for {INDIVIDUAL_COOLDOWN} seconds to avoid rate limiting...")
         
         # Update progress bar description with current status
-        tqdm.write(f"⏳ Sleeping for {INDIVIDUAL_COOLDOWN} seconds before next email to avoid rate limiting...")
+        tqdm.write(cooldown_message)
         time.sleep(INDIVIDUAL_COOLDOWN) # current rate is 10 requests per minute, bump from 6 to 7 so we don't get any errors
     
     log_failed_emails(failures)
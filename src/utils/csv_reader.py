@@ -10,6 +10,24 @@ import re
 from typing import List, Dict, Any, Optional
 
 
+# Titles skipped when deriving a first name from a full contact name
+_NAME_PREFIXES = frozenset({"mr", "mrs", "ms", "dr", "prof", "rev", "sir", "madam"})
+
+# Characters stripped from a derived first name
+_NON_ALPHA_PATTERN = re.compile(r'[^a-zA-Z]')
+
+# Basic email validation regex
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Contact list loaded by load_default_contacts
+_DEFAULT_CONTACTS_PATH = os.path.join(
+    os.path.dirname(__file__), 
+    "..", "..", 
+    "data", "contacts", 
+    "tier_i_tier_ii_emails_verified.csv"
+)
+
+
 class ContactParseError(Exception):
     """Exception raised when contact parsing fails."""
     pass
@@ -71,22 +89,13 @@ def _parse_contact_row(row: Dict[str, str]) -> Optional[Dict[str, Any]]:
     """
     # Extract and validate email
     email = row.get("Email", "").strip()
-    if not email or not _is_valid_email(email):
+    if not _is_valid_email(email):
         return None
     
     # Extract contact name and derive first name
     contact_name = row.get("Primary Contact Name", "").strip()
     first_name = _extract_first_name(contact_name)
     
-    # Build address from available fields
-    address_parts = []
-    for field in ["Address Line 1", "Address Line 2", "City", "State", "Zip Code"]:
-        value = row.get(field, "").strip()
-        if value:
-            address_parts.append(value)
-    
-    full_address = ", ".join(address_parts) if address_parts else ""
-    
     # Create contact dictionary preserving all original CSV fields
     contact = {
         # Original CSV fields (preserve exact column names)
@@ -112,8 +121,8 @@ def _parse_contact_row(row: Dict[str, str]) -> Optional[Dict[str, Any]]:
         "Business Purpose": row.get("Business Purpose", "").strip(),
         "Tier Type": row.get("Tier Type", "").strip(),
         "Processor Type": row.get("Processor Type", "").strip(),
-        "Primary Contact Name": row.get("Primary Contact Name", "").strip(),
-        "Email": row.get("Email", "").strip(),
+        "Primary Contact Name": contact_name,
+        "Email": email,
         
         # Additional tracking fields for email processing
         "first_name": first_name,
@@ -144,14 +153,13 @@ def _extract_first_name(contact_name: str) -> str:
     first_name = name_parts[0]
     
     # Clean up common prefixes/titles
-    prefixes_to_remove = {"mr", "mrs", "ms", "dr", "prof", "rev", "sir", "madam"}
     first_name_lower = first_name.lower().rstrip(".")
     
-    if first_name_lower in prefixes_to_remove and len(name_parts) > 1:
+    if first_name_lower in _NAME_PREFIXES and len(name_parts) > 1:
         first_name = name_parts[1]
     
     # Remove any non-alphabetic characters and capitalize
-    first_name = re.sub(r'[^a-zA-Z]', '', first_name)
+    first_name = _NON_ALPHA_PATTERN.sub('', first_name)
     return first_name.capitalize() if first_name else ""
 
 
@@ -167,9 +175,7 @@ def _is_valid_email(email: str) -> bool:
     if not email or "@" not in email:
         return False
     
-    # Basic email validation regex
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(email_pattern, email))
+    return bool(_EMAIL_PATTERN.match(email))
 
 
 def validate_contacts(contacts: List[Dict[str, Any]]) -> List[str]:
@@ -206,11 +212,4 @@ def load_default_contacts() -> List[Dict[str, Any]]:
     Raises:
         ContactParseError: If the default file cannot be loaded.
     """
-    default_path = os.path.join(
-        os.path.dirname(__file__), 
-        "..", "..", 
-        "data", "contacts", 
-        "tier_i_tier_ii_emails_verified.csv"
-    )
-    
-    return parse_contacts_from_csv(default_path)
\ No newline at end of file
+    return parse_contacts_from_csv(_DEFAULT_CONTACTS_PATH)
\ No newline at end of file
@@ -5,6 +5,11 @@ import os
 from typing import Dict, Any
 
 
+# Project root directory (go up from src/utils to project root), resolved once at import
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_CONFIG_PATH = os.path.join(_PROJECT_ROOT, "email_config.json")
+
+
 def load_email_config() -> Dict[str, Any]:
     """
     Load email configuration from the JSON file.
@@ -16,10 +21,7 @@ def load_email_config() -> Dict[str, Any]:
         FileNotFoundError: If the config file doesn't exist
         json.JSONDecodeError: If the JSON file is malformed
     """
-    # Get the project root directory (go up from src/utils to project root)
-    current_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.dirname(os.path.dirname(current_dir))
-    config_path = os.path.join(project_root, "email_config.json")  # ← Simplified path
+    config_path = _CONFIG_PATH
     
     try:
         with open(config_path, 'r', encoding='utf-8') as file:
@@ -27,7 +29,7 @@ def load_email_config() -> Dict[str, Any]:
             
             # Load HTML content if path is provided
             if config_data.get('html') and config_data['html'].strip():
-                html_path = os.path.join(project_root, config_data['html'])
+                html_path = os.path.join(_PROJECT_ROOT, config_data['html'])
                 try:
                     with open(html_path, 'r', encoding='utf-8') as html_file:
                         config_data['html_content'] = html_file.read()
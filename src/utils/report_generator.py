@@ -1,10 +1,21 @@
 import webbrowser
 import os
 from datetime import datetime
+from functools import lru_cache
 from typing import List, Dict, Any
 from jinja2 import Environment, FileSystemLoader
 
 
+# Report templates live in the project-level templates directory
+_TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'templates')
+
+
+@lru_cache(maxsize=None)
+def _get_template_environment() -> Environment:
+    """Build the Jinja2 environment once so compiled templates are reused across reports."""
+    return Environment(loader=FileSystemLoader(_TEMPLATE_DIR))
+
+
 def generate_email_summary_report(
     total_contacts: int,
     successful_count: int,
@@ -35,13 +46,14 @@ def generate_email_summary_report(
     # Ensure logs directory exists
     os.makedirs('logs', exist_ok=True)
     
+    # Read the clock once so the report body and its filename agree
+    now = datetime.now()
+    
     # Generate timestamp for the report
-    timestamp = timestamp_override if timestamp_override else datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    timestamp = timestamp_override if timestamp_override else now.strftime('%Y-%m-%d %H:%M:%S')
     
-    # Set up Jinja2 environment
-    template_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'templates')
-    env = Environment(loader=FileSystemLoader(template_dir))
-    template = env.get_template('report_template.html')
+    # Load template from the shared Jinja2 environment
+    template = _get_template_environment().get_template('report_template.html')
     
     # Render template with data
     html_content = template.render(
@@ -55,7 +67,7 @@ def generate_email_summary_report(
     )
     
     # Write HTML to file
-    timestamp_str = timestamp_override if timestamp_override else datetime.now().strftime("%Y%m%d_%H%M%S")
+    timestamp_str = timestamp_override if timestamp_override else now.strftime("%Y%m%d_%H%M%S")
     report_path = os.path.join('logs', f'email_report_{timestamp_str}.html')
     
     with open(report_path, 'w', encoding='utf-8') as f:
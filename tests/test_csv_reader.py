@@ -2,9 +2,7 @@
 
 import pytest
 import os
-import tempfile
-import csv
-from unittest.mock import patch, mock_open
+from unittest.mock import patch
 
 from src.utils.csv_reader import (
     parse_contacts_from_csv,
@@ -16,72 +14,69 @@ from src.utils.csv_reader import (
     _parse_contact_row
 )
 
+pytestmark = pytest.mark.csv
 
+
+@pytest.mark.unit
 class TestExtractFirstName:
     """Test suite for _extract_first_name function."""
     
-    def test_extract_first_name_single_name(self):
-        """Test extracting first name from single name."""
-        assert _extract_first_name("John") == "John"
-    
-    def test_extract_first_name_full_name(self):
-        """Test extracting first name from full name."""
-        assert _extract_first_name("John Doe") == "John"
-        assert _extract_first_name("Jane Mary Smith") == "Jane"
-    
-    def test_extract_first_name_with_title(self):
-        """Test extracting first name with title prefix."""
-        assert _extract_first_name("Dr. John Doe") == "John"
-        assert _extract_first_name("Mr. Smith Johnson") == "Smith"  
-        assert _extract_first_name("Mrs. Jane Doe") == "Jane"
-    
-    def test_extract_first_name_empty_string(self):
-        """Test extracting first name from empty string."""
-        assert _extract_first_name("") == ""
-    
-    def test_extract_first_name_whitespace_only(self):
-        """Test extracting first name from whitespace-only string."""
-        assert _extract_first_name("   ") == ""
-        assert _extract_first_name("\t\n") == ""
-    
-    def test_extract_first_name_leading_trailing_spaces(self):
-        """Test extracting first name with leading/trailing spaces."""
-        assert _extract_first_name("  John  ") == "John"
-        assert _extract_first_name("\tJane Doe\n") == "Jane"
-    
-    def test_extract_first_name_special_characters(self):
-        """Test extracting first name with special characters."""
-        assert _extract_first_name("John-Paul Smith") == "Johnpaul"
-        assert _extract_first_name("Mary.Jane Doe") == "Maryjane"
-        assert _extract_first_name("O'Connor") == "Oconnor"
+    @pytest.mark.parametrize("full_name, expected", [
+        ("John", "John"),
+        ("John Doe", "John"),
+        ("Jane Mary Smith", "Jane"),
+        ("Dr. John Doe", "John"),
+        ("Mr. Smith Johnson", "Smith"),
+        ("Mrs. Jane Doe", "Jane"),
+        ("", ""),
+        ("   ", ""),
+        ("\t\n", ""),
+        ("  John  ", "John"),
+        ("\tJane Doe\n", "Jane"),
+        ("John-Paul Smith", "Johnpaul"),
+        ("Mary.Jane Doe", "Maryjane"),
+        ("O'Connor", "Oconnor"),
+    ], ids=["single_name", "full_name", "three_part_name", "dr_title", "mr_title",
+            "mrs_title", "empty_string", "spaces_only", "tab_newline_only",
+            "surrounding_spaces", "surrounding_tab_newline", "hyphenated",
+            "dotted", "apostrophe"])
+    def test_extract_first_name(self, full_name, expected):
+        """Test extracting a first name from a full contact name."""
+        assert _extract_first_name(full_name) == expected
 
 
+@pytest.mark.unit
 class TestIsValidEmail:
     """Test suite for _is_valid_email function."""
     
-    def test_is_valid_email_standard_format(self):
+    @pytest.mark.parametrize("email", [
+        "test@example.com",
+        "user.name@domain.org",
+        "first.last+tag@subdomain.example.co.uk",
+        "user123@test-domain.com",
+        "user@domain.toolong",
+    ], ids=["simple", "dotted_local_part", "plus_tag_subdomain", "hyphenated_domain", "long_tld"])
+    def test_is_valid_email_accepts(self, email):
         """Test valid email formats."""
-        assert _is_valid_email("test@example.com") is True
-        assert _is_valid_email("user.name@domain.org") is True
-        assert _is_valid_email("first.last+tag@subdomain.example.co.uk") is True
-        assert _is_valid_email("user123@test-domain.com") is True
+        assert _is_valid_email(email) is True
     
-    def test_is_valid_email_invalid_format(self):
-        """Test email validation with invalid formats."""
-        assert _is_valid_email("invalid.email") == False
-        assert _is_valid_email("user@") == False
-        assert _is_valid_email("@domain.com") == False
-        assert _is_valid_email("user@domain") == False
-        assert _is_valid_email("user space@domain.com") == False
-    
-    def test_is_valid_email_edge_cases(self):
-        """Test edge cases for email validation."""
-        assert _is_valid_email("") is False
-        assert _is_valid_email("   ") is False
-        assert _is_valid_email("user@domain.c") is False  # TLD too short
-        assert _is_valid_email("user@domain.toolong") is True  # Should be valid
+    @pytest.mark.parametrize("email", [
+        "invalid.email",
+        "user@",
+        "@domain.com",
+        "user@domain",
+        "user space@domain.com",
+        "",
+        "   ",
+        "user@domain.c",
+    ], ids=["missing_at", "missing_domain", "missing_local_part", "missing_tld",
+            "space_in_local_part", "empty", "whitespace_only", "tld_too_short"])
+    def test_is_valid_email_rejects(self, email):
+        """Test email validation with invalid formats and edge cases."""
+        assert _is_valid_email(email) is False
 
 
+@pytest.mark.unit
 class TestParseContactRow:
     """Test suite for _parse_contact_row function."""
     
@@ -106,36 +101,17 @@ class TestParseContactRow:
         assert contact["Entity Name"] == "Test Company"
         assert contact["License Number"] == "12345"
     
-    def test_parse_contact_row_invalid_email(self):
-        """Test parsing row with invalid email."""
-        row = {
-            "Email": "invalid-email",
-            "Primary Contact Name": "John Doe"
-        }
-        
-        contact = _parse_contact_row(row)
-        assert contact is None
-    
-    def test_parse_contact_row_missing_email(self):
-        """Test parsing row with missing email."""
-        row = {
-            "Primary Contact Name": "John Doe"
-        }
-        
-        contact = _parse_contact_row(row)
-        assert contact is None
-    
-    def test_parse_contact_row_empty_email(self):
-        """Test parsing row with empty email."""
-        row = {
-            "Email": "",
-            "Primary Contact Name": "John Doe"
-        }
-        
-        contact = _parse_contact_row(row)
-        assert contact is None
+    @pytest.mark.parametrize("row", [
+        {"Email": "invalid-email", "Primary Contact Name": "John Doe"},
+        {"Primary Contact Name": "John Doe"},
+        {"Email": "", "Primary Contact Name": "John Doe"},
+    ], ids=["invalid_email", "missing_email", "empty_email"])
+    def test_parse_contact_row_rejects_email(self, row):
+        """Test parsing rows without a usable email."""
+        assert _parse_contact_row(row) is None
 
 
+@pytest.mark.unit
 class TestValidateContacts:
     """Test suite for validate_contacts function."""
     
@@ -149,99 +125,66 @@ class TestValidateContacts:
         errors = validate_contacts(contacts)
         assert errors == []
     
-    def test_validate_contacts_missing_email(self):
-        """Test validating contacts with missing email."""
-        contacts = [
-            {"first_name": "John"}
-        ]
-        
-        errors = validate_contacts(contacts)
-        assert len(errors) == 1
-        assert "Missing email address" in errors[0]
-    
-    def test_validate_contacts_invalid_email(self):
-        """Test validating contacts with invalid email."""
-        contacts = [
-            {"email": "invalid-email", "first_name": "John"}
-        ]
-        
-        errors = validate_contacts(contacts)
-        assert len(errors) == 1
-        assert "Invalid email format" in errors[0]
-    
-    def test_validate_contacts_missing_name(self):
-        """Test validating contacts with missing name fields."""
-        contacts = [
-            {"email": "john@example.com"}
-        ]
-        
-        errors = validate_contacts(contacts)
+    @pytest.mark.parametrize("contact, expected_error", [
+        ({"first_name": "John"}, "Missing email address"),
+        ({"email": "invalid-email", "first_name": "John"}, "Invalid email format"),
+        ({"email": "john@example.com"}, "Missing both first name and contact name"),
+    ], ids=["missing_email", "invalid_email", "missing_name"])
+    def test_validate_contacts_reports_error(self, contact, expected_error):
+        """Test validating contacts with a missing or invalid field."""
+        errors = validate_contacts([contact])
         assert len(errors) == 1
-        assert "Missing both first name and contact name" in errors[0]
+        assert expected_error in errors[0]
 
 
 class TestParseContactsFromCsv:
     """Test suite for parse_contacts_from_csv function."""
     
-    def test_parse_contacts_from_csv_valid_file(self):
+    def test_parse_contacts_from_csv_valid_file(self, tmp_path):
         """Test parsing valid CSV file."""
         csv_content = """Email,Primary Contact Name
 john@example.com,John Doe
 jane@example.com,Jane Smith"""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            f.flush()
-            temp_file_name = f.name
-            
-        try:
-            contacts = parse_contacts_from_csv(temp_file_name)
-            assert len(contacts) == 2
-            assert contacts[0]["Email"] == "john@example.com"
-            assert contacts[0]["first_name"] == "John"
-            assert contacts[1]["Email"] == "jane@example.com"
-            assert contacts[1]["first_name"] == "Jane"
-        finally:
-            os.unlink(temp_file_name)
+        csv_file = tmp_path / "contacts.csv"
+        csv_file.write_text(csv_content, encoding='utf-8')
+        
+        contacts = parse_contacts_from_csv(str(csv_file))
+        assert len(contacts) == 2
+        assert contacts[0]["Email"] == "john@example.com"
+        assert contacts[0]["first_name"] == "John"
+        assert contacts[1]["Email"] == "jane@example.com"
+        assert contacts[1]["first_name"] == "Jane"
     
     def test_parse_contacts_from_csv_file_not_found(self):
         """Test parsing non-existent CSV file."""
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError, match="CSV file not found: non_existent_file.csv"):
             parse_contacts_from_csv("non_existent_file.csv")
     
-    def test_parse_contacts_from_csv_invalid_contacts(self):
+    def test_parse_contacts_from_csv_invalid_contacts(self, tmp_path):
         """Test parsing CSV with invalid contacts."""
         csv_content = """Email,Primary Contact Name
 invalid-email,John Doe
 jane@example.com,Jane Smith"""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            f.flush()
-            temp_file_name = f.name
-            
-        try:
-            contacts = parse_contacts_from_csv(temp_file_name)
-            # Only valid contacts should be returned
-            assert len(contacts) == 1
-            assert contacts[0]["Email"] == "jane@example.com"
-        finally:
-            os.unlink(temp_file_name)
+        csv_file = tmp_path / "contacts.csv"
+        csv_file.write_text(csv_content, encoding='utf-8')
+        
+        contacts = parse_contacts_from_csv(str(csv_file))
+        # Only valid contacts should be returned
+        assert len(contacts) == 1
+        assert contacts[0]["Email"] == "jane@example.com"
     
-    def test_parse_contacts_from_csv_empty_file(self):
+    def test_parse_contacts_from_csv_empty_file(self, tmp_path):
         """Test parsing empty CSV file."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write("")
-            f.flush()
-            temp_file_name = f.name
-            
-        try:
-            contacts = parse_contacts_from_csv(temp_file_name)
-            assert contacts == []
-        finally:
-            os.unlink(temp_file_name)
+        csv_file = tmp_path / "contacts.csv"
+        csv_file.write_text("", encoding='utf-8')
+        
+        contacts = parse_contacts_from_csv(str(csv_file))
+        assert contacts == []
 
 
+@pytest.mark.unit
 class TestLoadDefaultContacts:
     """Test suite for load_default_contacts function."""
     
@@ -264,23 +207,20 @@ class TestLoadDefaultContacts:
         )
         mock_parse_contacts.assert_called_once()
     
+    @pytest.mark.parametrize("error", [
+        FileNotFoundError("File not found"),
+        ContactParseError("Parse error"),
+    ], ids=["file_not_found", "parse_error"])
     @patch('src.utils.csv_reader.parse_contacts_from_csv')
-    def test_load_default_contacts_file_not_found(self, mock_parse_contacts):
-        """Test loading default contacts when file not found."""
-        mock_parse_contacts.side_effect = FileNotFoundError("File not found")
-        
-        with pytest.raises(FileNotFoundError):
-            load_default_contacts()
-    
-    @patch('src.utils.csv_reader.parse_contacts_from_csv')
-    def test_load_default_contacts_parse_error(self, mock_parse_contacts):
-        """Test loading default contacts with parse error."""
-        mock_parse_contacts.side_effect = ContactParseError("Parse error")
+    def test_load_default_contacts_propagates_errors(self, mock_parse_contacts, error):
+        """Test that loading default contacts propagates parser errors."""
+        mock_parse_contacts.side_effect = error
         
-        with pytest.raises(ContactParseError):
+        with pytest.raises(type(error), match=str(error)):
             load_default_contacts()
 
 
+@pytest.mark.unit
 class TestContactParseError:
     """Test suite for ContactParseError exception."""
     
@@ -298,36 +238,31 @@ class TestContactParseError:
         assert isinstance(error, Exception)
 
 
+@pytest.mark.integration
 class TestCsvReaderIntegration:
     """Integration tests for csv_reader module."""
     
-    def test_full_csv_processing_workflow(self):
+    def test_full_csv_processing_workflow(self, tmp_path):
         """Test complete CSV processing workflow."""
         csv_content = """Email,Primary Contact Name,Entity Name,License Number
 john@example.com,John Doe,Test Company,12345
 jane@example.com,Jane Smith,Another Company,67890
 invalid-email,Bad Contact,Bad Company,11111"""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-            f.write(csv_content)
-            f.flush()
-            temp_file_name = f.name
-            
-        try:
-            # Parse contacts
-            contacts = parse_contacts_from_csv(temp_file_name)
-            assert len(contacts) == 2  # Only valid contacts
-            
-            # Validate contacts
-            errors = validate_contacts(contacts)
-            assert len(errors) == 0  # No validation errors for valid contacts
-            
-            # Check contact structure
-            for contact in contacts:
-                assert "Email" in contact
-                assert "first_name" in contact
-                assert "Primary Contact Name" in contact
-                assert _is_valid_email(contact["Email"])
-                
-        finally:
-            os.unlink(temp_file_name)
\ No newline at end of file
+        csv_file = tmp_path / "contacts.csv"
+        csv_file.write_text(csv_content, encoding='utf-8')
+        
+        # Parse contacts
+        contacts = parse_contacts_from_csv(str(csv_file))
+        assert len(contacts) == 2  # Only valid contacts
+        
+        # Validate contacts
+        errors = validate_contacts(contacts)
+        assert len(errors) == 0  # No validation errors for valid contacts
+        
+        # Check contact structure
+        for contact in contacts:
+            assert "Email" in contact
+            assert "first_name" in contact
+            assert "Primary Contact Name" in contact
+            assert _is_valid_email(contact["Email"])
\ No newline at end of file
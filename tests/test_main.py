@@ -1,22 +1,37 @@
 """Comprehensive test suite for main.py email campaign functionality."""
 
 import pytest
-import os
-import json
-import tempfile
+import re
 import logging
-from unittest.mock import Mock, patch, MagicMock, mock_open
-from datetime import datetime
-from io import StringIO
+from unittest.mock import Mock, patch, mock_open
 
+import src.main
 from src.main import (
     ColoredFormatter, 
     setup_logging, 
     log_failed_emails, 
     log_successful_emails, 
+    display_blast_summary,
+    request_blast_approval,
     send_in_bulk
 )
 
+# Email configuration patched over src.main.config, which send_in_bulk reads
+EMAIL_CONFIG = {
+    'subject': 'Test Subject',
+    'body': 'Hello {name}',
+    'html_content': '<p>Hello {name}</p>'
+}
+
+# Environment variables returned by the patched os.getenv
+SENDER_ENV = {
+    'TIERII_MAILERSEND_API_TOKEN': 'test_token',
+    'TIERII_SENDER_EMAIL': 'sender@test.com'
+}
+
+# Colorama escape sequences stripped from captured console output
+ANSI_ESCAPE = re.compile(r'\x1b\[[0-9;]*m')
+
 
 class TestColoredFormatter:
     """Test suite for ColoredFormatter class."""
@@ -25,7 +40,7 @@ class TestColoredFormatter:
         """Test ColoredFormatter can be initialized."""
         formatter = ColoredFormatter('%(levelname)s - %(message)s')
         assert formatter is not None
-        assert hasattr(formatter, 'COLORS')
+        assert formatter.COLORS is ColoredFormatter.COLORS
     
     def test_colored_formatter_colors_defined(self):
         """Test that all log levels have colors defined."""
@@ -238,24 +253,15 @@ class TestSendInBulk:
     @patch('src.main.EmailBuilder')
     @patch('src.main.MailerSendClient')
     @patch('src.main.parse_contacts_from_csv')
-    @patch('src.main.load_email_config')
+    @patch('src.main.config', EMAIL_CONFIG)
     @patch('src.main.request_blast_approval', return_value=True)
     @patch('os.getenv')
-    def test_send_in_bulk_successful_campaign(self, mock_getenv, mock_approval, mock_load_config, mock_parse_contacts, 
+    def test_send_in_bulk_successful_campaign(self, mock_getenv, mock_approval, mock_parse_contacts, 
                                             mock_mailersend, mock_email_builder, mock_logger, mock_tqdm,
-                                            mock_sleep, mock_log_failed, mock_log_successful, mock_generate_report):
+                                            mock_sleep, mock_log_failed, mock_log_successful, mock_generate_report, mock_email_builder_chain):
         """Test successful email campaign execution."""
         # Setup mocks
-        mock_getenv.side_effect = lambda key: {
-            'TIERII_MAILERSEND_API_TOKEN': 'test_token',
-            'TIERII_SENDER_EMAIL': 'sender@test.com'
-        }.get(key)
-        
-        mock_load_config.return_value = {
-            'subject': 'Test Subject',
-            'body': 'Hello {name}',
-            'html_content': '<p>Hello {name}</p>'
-        }
+        mock_getenv.side_effect = SENDER_ENV.get
         
         mock_contacts = [
             {
@@ -274,14 +280,7 @@ class TestSendInBulk:
         mock_client.emails.send.return_value = mock_response
         
         # Mock EmailBuilder
-        mock_builder = Mock()
-        mock_email_builder.return_value = mock_builder
-        mock_builder.from_email.return_value = mock_builder
-        mock_builder.to_many.return_value = mock_builder
-        mock_builder.subject.return_value = mock_builder
-        mock_builder.html.return_value = mock_builder
-        mock_builder.text.return_value = mock_builder
-        mock_builder.build.return_value = Mock()
+        mock_email_builder.return_value = mock_email_builder_chain
         
         # Mock tqdm
         mock_tqdm.return_value = mock_contacts
@@ -293,10 +292,17 @@ class TestSendInBulk:
         mock_parse_contacts.assert_called_once_with('data/test/testdata.csv')
         mock_mailersend.assert_called_once_with('test_token')
         mock_client.emails.send.assert_called_once()
+        mock_email_builder_chain.subject.assert_called_once_with('Test Subject')
+        mock_email_builder_chain.html.assert_called_once_with('<p>Hello Test</p>')
+        mock_email_builder_chain.text.assert_called_once_with('Hello Test')
         mock_log_failed.assert_called_once_with([])
         mock_log_successful.assert_called_once()
         mock_generate_report.assert_called_once()
     
+    @pytest.mark.parametrize("send_result, expected_status_code, expected_error", [
+        (Mock(status_code=400, text='Bad Request'), 400, 'Bad Request'),
+        (Exception('Network error'), 'exception', 'Network error'),
+    ], ids=['error_response', 'exception'])
     @patch('src.main.generate_email_summary_report')
     @patch('src.main.log_successful_emails')
     @patch('src.main.log_failed_emails')
@@ -306,24 +312,16 @@ class TestSendInBulk:
     @patch('src.main.EmailBuilder')
     @patch('src.main.MailerSendClient')
     @patch('src.main.parse_contacts_from_csv')
-    @patch('src.main.load_email_config')
+    @patch('src.main.config', EMAIL_CONFIG)
     @patch('src.main.request_blast_approval', return_value=True)
     @patch('os.getenv')
-    def test_send_in_bulk_failed_emails(self, mock_getenv, mock_approval, mock_load_config, mock_parse_contacts, 
+    def test_send_in_bulk_failed_emails(self, mock_getenv, mock_approval, mock_parse_contacts, 
                                        mock_mailersend, mock_email_builder, mock_logger, mock_tqdm,
-                                       mock_sleep, mock_log_failed, mock_log_successful, mock_generate_report):
-        """Test email campaign with failed emails."""
+                                       mock_sleep, mock_log_failed, mock_log_successful, mock_generate_report, mock_email_builder_chain,
+                                       send_result, expected_status_code, expected_error):
+        """Test email campaign with error responses and exceptions during sending."""
         # Setup mocks for failure scenario
-        mock_getenv.side_effect = lambda key: {
-            'TIERII_MAILERSEND_API_TOKEN': 'test_token',
-            'TIERII_SENDER_EMAIL': 'sender@test.com'
-        }.get(key)
-        
-        mock_load_config.return_value = {
-            'subject': 'Test Subject',
-            'body': 'Hello {name}',
-            'html_content': '<p>Hello {name}</p>'
-        }
+        mock_getenv.side_effect = SENDER_ENV.get
         
         mock_contacts = [
             {
@@ -334,23 +332,13 @@ class TestSendInBulk:
         ]
         mock_parse_contacts.return_value = mock_contacts
         
-        # Mock MailerSend client with failure response
+        # Mock MailerSend client to return the failure response or raise the exception
         mock_client = Mock()
         mock_mailersend.return_value = mock_client
-        mock_response = Mock()
-        mock_response.status_code = 400
-        mock_response.text = 'Bad Request'
-        mock_client.emails.send.return_value = mock_response
+        mock_client.emails.send.side_effect = [send_result]
         
         # Mock EmailBuilder
-        mock_builder = Mock()
-        mock_email_builder.return_value = mock_builder
-        mock_builder.from_email.return_value = mock_builder
-        mock_builder.to_many.return_value = mock_builder
-        mock_builder.subject.return_value = mock_builder
-        mock_builder.html.return_value = mock_builder
-        mock_builder.text.return_value = mock_builder
-        mock_builder.build.return_value = Mock()
+        mock_email_builder.return_value = mock_email_builder_chain
         
         # Mock tqdm
         mock_tqdm.return_value = mock_contacts
@@ -367,8 +355,8 @@ class TestSendInBulk:
         failed_calls = mock_log_failed.call_args[0][0]
         assert len(failed_calls) == 1
         assert failed_calls[0]['email_status'] == 'failed'
-        assert failed_calls[0]['status_code'] == 400
-        assert failed_calls[0]['error_message'] == 'Bad Request'
+        assert failed_calls[0]['status_code'] == expected_status_code
+        assert failed_calls[0]['error_message'] == expected_error
     
     @patch('src.main.generate_email_summary_report')
     @patch('src.main.log_successful_emails')
@@ -379,91 +367,15 @@ class TestSendInBulk:
     @patch('src.main.EmailBuilder')
     @patch('src.main.MailerSendClient')
     @patch('src.main.parse_contacts_from_csv')
-    @patch('src.main.load_email_config')
+    @patch('src.main.config', EMAIL_CONFIG)
     @patch('src.main.request_blast_approval', return_value=True)
     @patch('os.getenv')
-    def test_send_in_bulk_exception_handling(self, mock_getenv, mock_approval, mock_load_config, mock_parse_contacts, 
-                                           mock_mailersend, mock_email_builder, mock_logger, mock_tqdm,
-                                           mock_sleep, mock_log_failed, mock_log_successful, mock_generate_report):
-        """Test email campaign with exceptions during sending."""
-        # Setup mocks
-        mock_getenv.side_effect = lambda key: {
-            'TIERII_MAILERSEND_API_TOKEN': 'test_token',
-            'TIERII_SENDER_EMAIL': 'sender@test.com'
-        }.get(key)
-        
-        mock_load_config.return_value = {
-            'subject': 'Test Subject',
-            'body': 'Hello {name}',
-            'html_content': '<p>Hello {name}</p>'
-        }
-        
-        mock_contacts = [
-            {
-                'Email': 'test1@example.com',
-                'Primary Contact Name': 'Test User 1',
-                'first_name': 'Test'
-            }
-        ]
-        mock_parse_contacts.return_value = mock_contacts
-        
-        # Mock MailerSend client to raise exception
-        mock_client = Mock()
-        mock_mailersend.return_value = mock_client
-        mock_client.emails.send.side_effect = Exception('Network error')
-        
-        # Mock EmailBuilder
-        mock_builder = Mock()
-        mock_email_builder.return_value = mock_builder
-        mock_builder.from_email.return_value = mock_builder
-        mock_builder.to_many.return_value = mock_builder
-        mock_builder.subject.return_value = mock_builder
-        mock_builder.html.return_value = mock_builder
-        mock_builder.text.return_value = mock_builder
-        mock_builder.build.return_value = Mock()
-        
-        # Mock tqdm
-        mock_tqdm.return_value = mock_contacts
-        mock_tqdm.write = Mock()
-        
-        with patch('src.main.datetime') as mock_datetime:
-            mock_datetime.now.return_value.strftime.return_value = '2024-01-01 12:00:00'
-            send_in_bulk()
-        
-        # Verify exception handling
-        failed_calls = mock_log_failed.call_args[0][0]
-        assert len(failed_calls) == 1
-        assert failed_calls[0]['email_status'] == 'failed'
-        assert failed_calls[0]['status_code'] == 'exception'
-        assert failed_calls[0]['error_message'] == 'Network error'
-    
-    @patch('src.main.generate_email_summary_report')
-    @patch('src.main.log_successful_emails')
-    @patch('src.main.log_failed_emails')
-    @patch('src.main.time.sleep')
-    @patch('src.main.tqdm')
-    @patch('src.main.logger')
-    @patch('src.main.EmailBuilder')
-    @patch('src.main.MailerSendClient')
-    @patch('src.main.parse_contacts_from_csv')
-    @patch('src.main.load_email_config')
-    @patch('src.main.request_blast_approval', return_value=True)
-    @patch('os.getenv')
-    def test_send_in_bulk_empty_contacts(self, mock_getenv, mock_approval, mock_load_config, mock_parse_contacts, 
+    def test_send_in_bulk_empty_contacts(self, mock_getenv, mock_approval, mock_parse_contacts, 
                                         mock_mailersend, mock_email_builder, mock_logger, mock_tqdm,
                                         mock_sleep, mock_log_failed, mock_log_successful, mock_generate_report):
         """Test email campaign with empty contacts list."""
         # Setup mocks
-        mock_getenv.side_effect = lambda key: {
-            'TIERII_MAILERSEND_API_TOKEN': 'test_token',
-            'TIERII_SENDER_EMAIL': 'sender@test.com'
-        }.get(key)
-        
-        mock_load_config.return_value = {
-            'subject': 'Test Subject',
-            'body': 'Hello {name}',
-            'html_content': '<p>Hello {name}</p>'
-        }
+        mock_getenv.side_effect = SENDER_ENV.get
         
         mock_parse_contacts.return_value = []
         
@@ -491,24 +403,15 @@ class TestSendInBulk:
     @patch('src.main.EmailBuilder')
     @patch('src.main.MailerSendClient')
     @patch('src.main.parse_contacts_from_csv')
-    @patch('src.main.load_email_config')
+    @patch('src.main.config', EMAIL_CONFIG)
     @patch('src.main.request_blast_approval', return_value=True)
     @patch('os.getenv')
-    def test_send_in_bulk_success_rate_calculation(self, mock_getenv, mock_approval, mock_load_config, mock_parse_contacts, 
+    def test_send_in_bulk_success_rate_calculation(self, mock_getenv, mock_approval, mock_parse_contacts, 
                                                   mock_mailersend, mock_email_builder, mock_logger, mock_tqdm,
-                                                  mock_sleep, mock_log_failed, mock_log_successful, mock_generate_report):
+                                                  mock_sleep, mock_log_failed, mock_log_successful, mock_generate_report, mock_email_builder_chain):
         """Test success rate calculation with mixed results."""
         # Setup mocks
-        mock_getenv.side_effect = lambda key: {
-            'TIERII_MAILERSEND_API_TOKEN': 'test_token',
-            'TIERII_SENDER_EMAIL': 'sender@test.com'
-        }.get(key)
-        
-        mock_load_config.return_value = {
-            'subject': 'Test Subject',
-            'body': 'Hello {name}',
-            'html_content': '<p>Hello {name}</p>'
-        }
+        mock_getenv.side_effect = SENDER_ENV.get
         
         mock_contacts = [
             {'Email': 'success@example.com', 'Primary Contact Name': 'Success User', 'first_name': 'Success'},
@@ -524,14 +427,7 @@ class TestSendInBulk:
         mock_client.emails.send.side_effect = responses
         
         # Mock EmailBuilder
-        mock_builder = Mock()
-        mock_email_builder.return_value = mock_builder
-        mock_builder.from_email.return_value = mock_builder
-        mock_builder.to_many.return_value = mock_builder
-        mock_builder.subject.return_value = mock_builder
-        mock_builder.html.return_value = mock_builder
-        mock_builder.text.return_value = mock_builder
-        mock_builder.build.return_value = Mock()
+        mock_email_builder.return_value = mock_email_builder_chain
         
         # Mock tqdm
         mock_tqdm.return_value = mock_contacts
@@ -552,10 +448,8 @@ class TestSendInBulk:
 class TestBlastApproval:
     """Test suite for blast approval functionality."""
     
-    def test_display_blast_summary_shows_all_info(self, capsys):
+    def test_display_blast_summary_shows_all_info(self, capsys, monkeypatch):
         """Test that blast summary displays all required information."""
-        from src.main import display_blast_summary
-        
         contacts = [
             {
                 'Email': 'test1@example.com',
@@ -571,14 +465,13 @@ class TestBlastApproval:
             }
         ]
         
-        with patch('src.main.config', {'subject': 'Test Subject'}):
-            with patch('os.getenv', return_value='sender@test.com'):
-                display_blast_summary(contacts)
+        monkeypatch.setattr(src.main, 'config', {'subject': 'Test Subject'})
+        monkeypatch.setenv('TIERII_SENDER_EMAIL', 'sender@test.com')
+        display_blast_summary(contacts)
         
         captured = capsys.readouterr()
         # Strip ANSI color codes for easier testing
-        import re
-        output = re.sub(r'\x1b\[[0-9;]*m', '', captured.out)
+        output = ANSI_ESCAPE.sub('', captured.out)
         
         assert 'EMAIL BLAST SUMMARY' in output
         assert 'Total Contacts:' in output
@@ -588,10 +481,9 @@ class TestBlastApproval:
         assert 'John Doe' in output
         assert 'Jane Smith' in output
     
-    def test_display_blast_summary_preview_limit(self, capsys):
-        """Test that blast summary shows only first 5 contacts."""
-        from src.main import display_blast_summary
-        
+    @pytest.mark.parametrize("contact_count", [0, 1, 5, 10])
+    def test_display_blast_summary_preview_limit(self, capsys, monkeypatch, contact_count):
+        """Test that blast summary reports the total and previews at most 5 contacts."""
         contacts = [
             {
                 'Email': f'test{i}@example.com',
@@ -599,58 +491,56 @@ class TestBlastApproval:
                 'Entity Name': f'Company {i}',
                 'first_name': f'User{i}'
             }
-            for i in range(10)
+            for i in range(contact_count)
         ]
         
-        with patch('src.main.config', {'subject': 'Test Subject'}):
-            with patch('os.getenv', return_value='sender@test.com'):
-                display_blast_summary(contacts)
+        monkeypatch.setattr(src.main, 'config', {'subject': 'Test Subject'})
+        monkeypatch.setenv('TIERII_SENDER_EMAIL', 'sender@test.com')
+        display_blast_summary(contacts)
         
         captured = capsys.readouterr()
-        assert 'and 5 more' in captured.out
-        assert 'User 0' in captured.out  # First contact shown
-        assert 'User 4' in captured.out  # 5th contact shown
-    
-    @patch('builtins.input', return_value='yes')
-    @patch('src.main.logger')
-    def test_request_blast_approval_user_approves(self, mock_logger, mock_input):
-        """Test blast approval when user confirms."""
-        from src.main import request_blast_approval
-        
-        contacts = [{'Email': 'test@example.com', 'Primary Contact Name': 'Test'}]
-        
-        with patch('src.main.display_blast_summary'):
-            result = request_blast_approval(contacts)
-        
-        assert result is True
-        mock_logger.info.assert_called_once()
-        assert 'approved' in mock_logger.info.call_args[0][0].lower()
+        # Strip ANSI color codes for easier testing
+        output = ANSI_ESCAPE.sub('', captured.out)
+        preview_count = min(5, contact_count)
+        
+        assert f'Total Contacts: {contact_count}' in output
+        assert f'Preview of first {preview_count} recipients' in output
+        for i in range(contact_count):
+            shown = f'User {i} (test{i}@example.com)' in output
+            assert shown is (i < preview_count)
+        if contact_count > preview_count:
+            assert f'and {contact_count - preview_count} more' in output
+        else:
+            assert 'more' not in output
     
-    @patch('builtins.input', return_value='no')
+    @pytest.mark.parametrize("response, expected, log_method, log_keyword", [
+        ('yes', True, 'info', 'approved'),
+        ('y', True, 'info', 'approved'),
+        ('no', False, 'warning', 'cancelled'),
+        ('n', False, 'warning', 'cancelled'),
+    ], ids=['yes', 'shorthand_yes', 'no', 'shorthand_no'])
     @patch('src.main.logger')
-    def test_request_blast_approval_user_rejects(self, mock_logger, mock_input):
-        """Test blast approval when user rejects."""
-        from src.main import request_blast_approval
-        
+    def test_request_blast_approval_response(self, mock_logger, monkeypatch, response, expected, log_method, log_keyword):
+        """Test blast approval for full and shorthand yes/no answers."""
         contacts = [{'Email': 'test@example.com', 'Primary Contact Name': 'Test'}]
         
-        with patch('src.main.display_blast_summary'):
-            result = request_blast_approval(contacts)
+        monkeypatch.setattr('builtins.input', lambda prompt: response)
+        monkeypatch.setattr(src.main, 'display_blast_summary', lambda contacts: None)
+        result = request_blast_approval(contacts)
         
-        assert result is False
-        mock_logger.warning.assert_called_once()
-        assert 'cancelled' in mock_logger.warning.call_args[0][0].lower()
+        assert result is expected
+        log_call = getattr(mock_logger, log_method)
+        log_call.assert_called_once()
+        assert log_keyword in log_call.call_args[0][0].lower()
     
     @patch('builtins.input', side_effect=['invalid', 'maybe', 'yes'])
     @patch('src.main.logger')
-    def test_request_blast_approval_invalid_input_retry(self, mock_logger, mock_input, capsys):
+    def test_request_blast_approval_invalid_input_retry(self, mock_logger, mock_input, capsys, monkeypatch):
         """Test blast approval handles invalid input and retries."""
-        from src.main import request_blast_approval
-        
         contacts = [{'Email': 'test@example.com', 'Primary Contact Name': 'Test'}]
         
-        with patch('src.main.display_blast_summary'):
-            result = request_blast_approval(contacts)
+        monkeypatch.setattr(src.main, 'display_blast_summary', lambda contacts: None)
+        result = request_blast_approval(contacts)
         
         assert result is True
         assert mock_input.call_count == 3  # Called 3 times due to invalid inputs
@@ -658,32 +548,6 @@ class TestBlastApproval:
         captured = capsys.readouterr()
         assert 'Invalid input' in captured.out
     
-    @patch('builtins.input', return_value='y')
-    @patch('src.main.logger')
-    def test_request_blast_approval_shorthand_yes(self, mock_logger, mock_input):
-        """Test blast approval accepts 'y' as yes."""
-        from src.main import request_blast_approval
-        
-        contacts = [{'Email': 'test@example.com', 'Primary Contact Name': 'Test'}]
-        
-        with patch('src.main.display_blast_summary'):
-            result = request_blast_approval(contacts)
-        
-        assert result is True
-    
-    @patch('builtins.input', return_value='n')
-    @patch('src.main.logger')
-    def test_request_blast_approval_shorthand_no(self, mock_logger, mock_input):
-        """Test blast approval accepts 'n' as no."""
-        from src.main import request_blast_approval
-        
-        contacts = [{'Email': 'test@example.com', 'Primary Contact Name': 'Test'}]
-        
-        with patch('src.main.display_blast_summary'):
-            result = request_blast_approval(contacts)
-        
-        assert result is False
-    
     @patch('src.main.request_blast_approval', return_value=False)
     @patch('src.main.parse_contacts_from_csv')
     @patch('src.main.MailerSendClient')
@@ -691,8 +555,6 @@ class TestBlastApproval:
     def test_send_in_bulk_aborts_without_approval(self, mock_logger, mock_client, 
                                                    mock_parse, mock_approval):
         """Test that send_in_bulk aborts when approval is denied."""
-        from src.main import send_in_bulk
-        
         mock_contacts = [{'Email': 'test@example.com', 'first_name': 'Test'}]
         mock_parse.return_value = mock_contacts
         
@@ -716,44 +578,26 @@ class TestBlastApproval:
     @patch('src.main.tqdm')
     @patch('src.main.request_blast_approval', return_value=True)
     @patch('src.main.parse_contacts_from_csv')
-    @patch('src.main.load_email_config')
+    @patch('src.main.config', EMAIL_CONFIG)
     @patch('src.main.EmailBuilder')
     @patch('src.main.MailerSendClient')
     @patch('src.main.logger')
     @patch('os.getenv')
     def test_send_in_bulk_proceeds_with_approval(self, mock_getenv, mock_logger, mock_client,
-                                                 mock_builder_cls, mock_config, mock_parse,
+                                                 mock_builder_cls, mock_parse,
                                                  mock_approval, mock_tqdm, mock_sleep,
-                                                 mock_log_failed, mock_log_success, mock_report):
+                                                 mock_log_failed, mock_log_success, mock_report, mock_email_builder_chain):
         """Test that send_in_bulk proceeds when approval is granted."""
-        from src.main import send_in_bulk
-        
         # Setup mocks
-        mock_getenv.side_effect = lambda key: {
-            'TIERII_MAILERSEND_API_TOKEN': 'test_token',
-            'TIERII_SENDER_EMAIL': 'sender@test.com'
-        }.get(key)
-        
-        mock_config.return_value = {
-            'subject': 'Test',
-            'body': 'Hello {name}',
-            'html_content': '<p>Hello {name}</p>'
-        }
+        mock_getenv.side_effect = SENDER_ENV.get
         
         mock_contacts = [
             {'Email': 'test@example.com', 'Primary Contact Name': 'Test', 'first_name': 'Test'}
         ]
         mock_parse.return_value = mock_contacts
         
-        # Mock email builder
-        mock_builder = Mock()
-        mock_builder_cls.return_value = mock_builder
-        mock_builder.from_email.return_value = mock_builder
-        mock_builder.to_many.return_value = mock_builder
-        mock_builder.subject.return_value = mock_builder
-        mock_builder.html.return_value = mock_builder
-        mock_builder.text.return_value = mock_builder
-        mock_builder.build.return_value = Mock()
+        # Mock EmailBuilder
+        mock_builder_cls.return_value = mock_email_builder_chain
         
         # Mock successful response
         mock_response = Mock(status_code=202)
@@ -770,22 +614,6 @@ class TestBlastApproval:
         
         # Verify emails were sent
         mock_client.return_value.emails.send.assert_called_once()
-    
-    def test_display_blast_summary_empty_contacts(self, capsys):
-        """Test blast summary with empty contact list."""
-        from src.main import display_blast_summary
-        
-        with patch('src.main.config', {'subject': 'Test Subject'}):
-            with patch('os.getenv', return_value='sender@test.com'):
-                display_blast_summary([])
-        
-        captured = capsys.readouterr()
-        # Strip ANSI color codes for easier testing
-        import re
-        output = re.sub(r'\x1b\[[0-9;]*m', '', captured.out)
-        
-        assert 'Total Contacts:' in output
-        assert '0' in output
 
 
 class TestMainModuleIntegration:
@@ -794,10 +622,6 @@ class TestMainModuleIntegration:
     @patch('src.main.send_in_bulk')
     def test_main_execution(self, mock_send_in_bulk):
         """Test main module execution."""
-        # Import and test main execution
-        import src.main
-        
         # Verify that if __name__ == "__main__" would call send_in_bulk
         # This tests the module structure without actually running it
-        assert hasattr(src.main, 'send_in_bulk')
         assert callable(src.main.send_in_bulk)
\ No newline at end of file
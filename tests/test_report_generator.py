@@ -1,7 +1,6 @@
 import pytest
 import os
-import tempfile
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from datetime import datetime
 
 from src.utils.report_generator import generate_email_summary_report
@@ -10,26 +9,6 @@ from src.utils.report_generator import generate_email_summary_report
 class TestReportGenerator:
     """Test suite for the report generator functionality."""
 
-    @pytest.fixture
-    def temp_logs_dir(self):
-        """Create a temporary logs directory for testing."""
-        import tempfile
-        import shutil
-        
-        # Create temporary directory
-        temp_dir = tempfile.mkdtemp()
-        
-        # Change to temp directory and create logs subdirectory
-        original_cwd = os.getcwd()
-        os.chdir(temp_dir)
-        os.makedirs('logs', exist_ok=True)
-        
-        yield temp_dir
-        
-        # Cleanup
-        os.chdir(original_cwd)
-        shutil.rmtree(temp_dir)
-
     @pytest.fixture
     def sample_failed_contacts(self):
         """Sample failed contacts for testing."""
@@ -50,8 +29,7 @@ class TestReportGenerator:
             }
         ]
 
-    @patch('webbrowser.open')
-    def test_generate_report_all_successful(self, mock_browser, temp_logs_dir):
+    def test_generate_report_all_successful(self, mock_webbrowser, temp_logs_dir):
         """Test report generation when all emails are successful."""
         total_contacts = 3
         successful_count = 3
@@ -68,7 +46,7 @@ class TestReportGenerator:
         assert report_path.endswith('.html')
         
         # Verify browser was opened
-        mock_browser.assert_called_once()
+        mock_webbrowser.assert_called_once()
 
         # Verify report content
         with open(report_path, 'r', encoding='utf-8') as f:
@@ -88,8 +66,7 @@ class TestReportGenerator:
         assert 'No failed email deliveries to report' in content
         assert '<table class="failures-table">' not in content
 
-    @patch('webbrowser.open')
-    def test_generate_report_all_failed(self, mock_browser, temp_logs_dir, sample_failed_contacts):
+    def test_generate_report_all_failed(self, mock_webbrowser, temp_logs_dir, sample_failed_contacts):
         """Test report generation when all emails fail."""
         total_contacts = 2
         successful_count = 0
@@ -104,7 +81,7 @@ class TestReportGenerator:
         assert os.path.exists(report_path)
         
         # Verify browser was opened
-        mock_browser.assert_called_once()
+        mock_webbrowser.assert_called_once()
 
         # Verify report content
         with open(report_path, 'r', encoding='utf-8') as f:
@@ -127,8 +104,7 @@ class TestReportGenerator:
         assert 'Jane Smith' in content
         assert 'Invalid email format' in content
 
-    @patch('webbrowser.open')
-    def test_generate_report_mixed_results(self, mock_browser, temp_logs_dir):
+    def test_generate_report_mixed_results(self, mock_webbrowser, temp_logs_dir):
         """Test report generation with mixed success and failure results."""
         total_contacts = 5
         successful_count = 3
@@ -152,7 +128,7 @@ class TestReportGenerator:
         assert os.path.exists(report_path)
         
         # Verify browser was opened
-        mock_browser.assert_called_once()
+        mock_webbrowser.assert_called_once()
 
         # Verify report content
         with open(report_path, 'r', encoding='utf-8') as f:
@@ -168,8 +144,7 @@ class TestReportGenerator:
         assert 'Delivery Details' in content
         assert 'failed@example.com' in content
 
-    @patch('webbrowser.open')
-    def test_generate_report_empty_lists(self, mock_browser, temp_logs_dir):
+    def test_generate_report_empty_lists(self, mock_webbrowser, temp_logs_dir):
         """Test report generation with empty contact lists."""
         total_contacts = 0
         successful_count = 0
@@ -185,7 +160,7 @@ class TestReportGenerator:
         assert os.path.exists(report_path)
         
         # Verify browser was opened
-        mock_browser.assert_called_once()
+        mock_webbrowser.assert_called_once()
 
         # Verify report content
         with open(report_path, 'r', encoding='utf-8') as f:
@@ -200,8 +175,7 @@ class TestReportGenerator:
         # Check no failures message
         assert 'No failed email deliveries to report' in content
 
-    @patch('webbrowser.open')
-    def test_generate_report_with_special_characters(self, mock_browser, temp_logs_dir):
+    def test_generate_report_with_special_characters(self, temp_logs_dir):
         """Test report generation with special characters in contact data."""
         failed_contacts = [
             {
@@ -229,8 +203,7 @@ class TestReportGenerator:
         assert 'München' in content
         assert 'ñ character' in content
 
-    @patch('webbrowser.open')
-    def test_generate_report_missing_contact_fields(self, mock_browser, temp_logs_dir):
+    def test_generate_report_missing_contact_fields(self, temp_logs_dir):
         """Test report generation when contacts have missing optional fields."""
         failed_contacts = [
             {
@@ -253,8 +226,7 @@ class TestReportGenerator:
         assert 'incomplete@example.com' in content
         assert 'N/A' in content  # Should show N/A for missing fields
 
-    @patch('webbrowser.open')
-    def test_generate_report_custom_title(self, mock_browser, temp_logs_dir):
+    def test_generate_report_custom_title(self, temp_logs_dir):
         """Test report generation with custom title."""
         custom_title = "Custom Campaign Report"
         
@@ -271,8 +243,7 @@ class TestReportGenerator:
 
         assert f'<title>{custom_title}</title>' in content
 
-    @patch('webbrowser.open')
-    def test_generate_report_timestamp_in_filename(self, mock_browser, temp_logs_dir):
+    def test_generate_report_timestamp_in_filename(self, temp_logs_dir):
         """Test that generated report filename contains timestamp."""
         report_path = generate_email_summary_report(1, 1, 0, 100.0, [])
 
@@ -288,13 +259,9 @@ class TestReportGenerator:
         assert '_' in timestamp_str
         
         # Verify it can be parsed as a valid datetime
-        try:
-            datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
-        except ValueError:
-            pytest.fail(f"Timestamp {timestamp_str} is not in expected format YYYYMMDD_HHMMSS")
+        datetime.strptime(timestamp_str, '%Y%m%d_%H%M%S')
 
-    @patch('webbrowser.open')
-    def test_generate_report_creates_logs_directory(self, mock_browser, temp_logs_dir):
+    def test_generate_report_creates_logs_directory(self, temp_logs_dir):
         """Test that logs directory is created if it doesn't exist."""
         # Remove the logs directory
         if os.path.exists('logs'):
@@ -310,27 +277,21 @@ class TestReportGenerator:
         log_files = [f for f in os.listdir('logs') if f.startswith('email_report_')]
         assert len(log_files) == 1
 
-    @patch('webbrowser.open')
-    def test_generate_report_browser_error(self, mock_browser, temp_logs_dir):
+    def test_generate_report_browser_error(self, mock_webbrowser, temp_logs_dir):
         """Test report generation when browser fails to open."""
-        mock_browser.side_effect = Exception("Browser error")
-
-        # Should still generate report even if browser fails
-        # The function should handle the browser error gracefully
-        try:
-            report_path = generate_email_summary_report(1, 1, 0, 100.0, [])
-            # If we get here, the function handled the error gracefully
-            assert os.path.exists(report_path)
-        except Exception as e:
-            # If the function doesn't handle browser errors, that's also acceptable behavior
-            # as long as it's the browser error being propagated
-            assert "Browser error" in str(e)
+        mock_webbrowser.side_effect = Exception("Browser error")
+
+        # The browser error propagates, but only after the report has been written
+        with pytest.raises(Exception, match="Browser error"):
+            generate_email_summary_report(1, 1, 0, 100.0, [])
+        
+        log_files = [f for f in os.listdir(temp_logs_dir) if f.startswith('email_report_')]
+        assert len(log_files) == 1
         
         # Verify browser open was attempted
-        mock_browser.assert_called_once()
+        mock_webbrowser.assert_called_once()
 
-    @patch('webbrowser.open')
-    def test_generate_report_long_error_message_truncation(self, mock_browser, temp_logs_dir):
+    def test_generate_report_long_error_message_truncation(self, temp_logs_dir):
         """Test that long error messages are properly truncated."""
         long_error = "A" * 150  # 150 character error message
         failed_contacts = [
@@ -355,49 +316,19 @@ class TestReportGenerator:
         assert long_error[:100] in content
         assert '...' in content
 
-    @patch('webbrowser.open')
     @patch('os.makedirs')
-    def test_generate_report_permission_error(self, mock_makedirs, mock_browser, temp_logs_dir):
+    def test_generate_report_permission_error(self, mock_makedirs, temp_logs_dir):
         """Test handling of permission errors when creating directories."""
         mock_makedirs.side_effect = PermissionError("Permission denied")
 
-        with pytest.raises(PermissionError):
+        with pytest.raises(PermissionError, match="Permission denied"):
             generate_email_summary_report(1, 1, 0, 100.0, [])
 
-    def test_template_rendering_no_failures(self):
-        """Test template rendering with no failed contacts."""
-        # This test is now covered by the main report generation tests
-        # since the template handles the no-failures case internally
-        pass
-
-    def test_template_rendering_with_failures(self, sample_failed_contacts):
-        """Test template rendering with failed contacts."""
-        # This test is now covered by the main report generation tests
-        # since the template handles the failures table internally
-        pass
-
 
 class TestReportGeneratorIntegration:
     """Integration tests for report generator with various scenarios."""
 
-    @pytest.fixture
-    def temp_logs_dir(self):
-        """Create a temporary logs directory for testing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            logs_dir = os.path.join(temp_dir, 'logs')
-            os.makedirs(logs_dir, exist_ok=True)
-            
-            # Change to temp directory for testing
-            original_cwd = os.getcwd()
-            os.chdir(temp_dir)
-            
-            yield logs_dir
-            
-            # Restore original directory
-            os.chdir(original_cwd)
-
-    @patch('webbrowser.open')
-    def test_report_cross_platform_compatibility(self, mock_browser, temp_logs_dir):
+    def test_report_cross_platform_compatibility(self, temp_logs_dir):
         """Test report generation works across different platforms."""
         report_path = generate_email_summary_report(1, 1, 0, 100.0, [])
 
@@ -415,31 +346,19 @@ class TestReportGeneratorIntegration:
         assert '<!DOCTYPE html>' in content
         assert '</html>' in content
 
-    @patch('webbrowser.open')
-    def test_concurrent_report_generation(self, mock_browser, temp_logs_dir):
+    def test_concurrent_report_generation(self, temp_logs_dir):
         """Test that concurrent report generation creates unique files."""
-        import threading
-        import time
-        
-        report_paths = []
-        
+        from concurrent.futures import ThreadPoolExecutor
+
         def generate_report(index):
             # Use unique timestamp override for each thread
             timestamp = f"20250926_13060{index}"
-            path = generate_email_summary_report(10, 8, 2, 80.0, [], timestamp_override=timestamp)
-            report_paths.append(path)
-        
-        # Create threads with unique timestamp overrides
-        threads = []
-        for i in range(3):
-            thread = threading.Thread(target=generate_report, args=(i,))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
-        
+            return generate_email_summary_report(10, 8, 2, 80.0, [], timestamp_override=timestamp)
+
+        # Generate reports on a shared worker pool with unique timestamp overrides
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            report_paths = list(executor.map(generate_report, range(3)))
+
         # Verify all reports were created with unique filenames
         assert len(report_paths) == 3
         assert len(set(report_paths)) == 3  # All paths should be unique